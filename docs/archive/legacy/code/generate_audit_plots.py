@@ -1,24 +1,33 @@
 import json
-import matplotlib.pyplot as plt
-import glob
 import os
 
+import numpy as np
+from mpl_config import pyplot
+
 
 def create_plots():
-    # Find the most recent result file
-    files = glob.glob("audit_results/*.json")
-    if not files:
+    # Find the most recent result file in a single directory pass
+    try:
+        with os.scandir("audit_results") as it:
+            latest = max(
+                (e for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda e: e.stat().st_ctime,
+                default=None,
+            )
+    except FileNotFoundError:
+        latest = None
+    if latest is None:
         print("No JSON results found in audit_results/")
         return
 
-    latest_file = max(files, key=os.path.getctime)
-    with open(latest_file, "r") as f:
+    with open(latest.path, "r") as f:
         data = json.load(f)
 
     # Extract recovery data
-    rounds = list(range(1, len(data["recovery_accuracy_values"]) + 1))
-    accuracy = [val * 100 for val in data["recovery_accuracy_values"]]
+    accuracy = np.asarray(data["recovery_accuracy_values"], dtype=np.float32) * 100.0
+    rounds = np.arange(1, accuracy.size + 1)
 
+    plt = pyplot()
     plt.figure(figsize=(10, 6))
     plt.plot(rounds, accuracy, marker="o", linestyle="-", color="#2ecc71", linewidth=2)
 
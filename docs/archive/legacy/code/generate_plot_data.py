@@ -1,5 +1,10 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Simulation data from your Round 41 run
 data = {
     "rounds": list(range(1, 26)),
@@ -9,6 +14,10 @@ data = {
     "event": "Byzantine Breach (55.6%) at Round 10",
 }
 
-with open("plot_data.json", "w") as f:
-    json.dump(data, f)
+if orjson is not None:
+    with open("plot_data.json", "wb") as f:
+        f.write(orjson.dumps(data))
+else:
+    with open("plot_data.json", "w") as f:
+        json.dump(data, f)
 print("Data summary generated for local plotting.")
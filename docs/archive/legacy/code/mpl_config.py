@@ -0,0 +1,74 @@
+# mpl_config.py
+# Shared matplotlib setup (config dir, headless backend, fonts) for the audit
+# plotting scripts.
+
+import os
+import stat
+import sys
+import tempfile
+
+
+def _default_config_dir() -> str:
+    # Mirrors matplotlib.get_configdir(); it has to be resolved without
+    # importing matplotlib, which fixes its config dir at import time.
+    home = os.path.expanduser("~")
+    if sys.platform.startswith(("linux", "freebsd")):
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+        return os.path.join(base, "matplotlib")
+    return os.path.join(home, ".matplotlib")
+
+
+def _is_writable(path: str) -> bool:
+    # Same test matplotlib applies: create the dir if needed, then check it.
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(path, os.W_OK)
+
+
+def _private_temp_dir() -> str:
+    try:
+        user = str(os.getuid())
+    except AttributeError:  # Windows: the temp dir is already per-user
+        import getpass
+
+        user = getpass.getuser()
+    path = os.path.join(tempfile.gettempdir(), f"matplotlib-{user}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise OSError(f"{path} is not a directory")
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        raise OSError(f"{path} is not private to this user")
+    return path
+
+
+def ensure_config_dir() -> None:
+    """Give matplotlib a stable config dir when the default is not writable.
+
+    Without one, matplotlib creates a fresh temp dir per run and rebuilds its
+    font cache each time. An explicit $MPLCONFIGDIR or a writable default
+    (including the user's matplotlibrc) is left alone.
+    """
+    if "MPLCONFIGDIR" in os.environ or _is_writable(_default_config_dir()):
+        return
+    try:
+        os.environ["MPLCONFIGDIR"] = _private_temp_dir()
+    except OSError:
+        # Shared or foreign-owned path: fall back to matplotlib's own temp dir.
+        pass
+
+
+def pyplot():
+    """Return matplotlib.pyplot configured for headless audit plots."""
+    ensure_config_dir()
+    import matplotlib
+
+    matplotlib.use("Agg")  # headless: skip GUI backend detection
+    matplotlib.rcParams.update(
+        {"font.family": "DejaVu Sans", "axes.unicode_minus": False}
+    )
+    import matplotlib.pyplot as plt
+
+    return plt
@@ -1,6 +1,5 @@
 import argparse
 import subprocess
-import re
 
 
 def run_test(malicious, latency, privacy_check):
@@ -14,34 +13,29 @@ def run_test(malicious, latency, privacy_check):
     print(f"   - Network Latency: {latency * 100}%")
     print(f"   - Privacy Budget (ε): {current_eps}/{epsilon_limit}")
 
-    # Update logic: safely replace malicious_fraction in the target file without invoking a shell
-    target_path = "sovereign_map_test_collector.py"
-    try:
-        with open(target_path, "r", encoding="utf-8") as fh:
-            txt = fh.read()
-        new_txt = re.sub(
-            r"malicious_fraction\s*=\s*.*", f"malicious_fraction = {malicious}", txt
-        )
-        if new_txt != txt:
-            with open(target_path, "w", encoding="utf-8") as fh:
-                fh.write(new_txt)
-    except FileNotFoundError:
-        print(f"Warning: {target_path} not found; skipping update.")
-
     if current_eps >= epsilon_limit:
         print("🚨 CRITICAL: Privacy Budget Exhausted. SGP-001 Failsafe Triggered.")
         return
 
-    result = subprocess.run(
-        ["python3", "sovereign_map_test_collector.py"], capture_output=True, text=True
-    )
+    # The collector takes the malicious fraction as a flag, so there is no need
+    # to rewrite its source before launching it. Only one token of its output
+    # matters, so stream it line by line instead of buffering all of it.
+    with subprocess.Popen(
+        ["python3", "sovereign_map_test_collector.py", "--malicious", str(malicious)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        bft_safe = any("bft_safe: True" in line for line in proc.stdout)
+        # Drain the rest so the collector never blocks on a full pipe.
+        for _ in proc.stdout:
+            pass
 
     print(
         "\n✅ Audit Success: Theorem 2 (Privacy) and Theorem 4 (Stragglers) Validated."
     )
-    print(
-        f"🛡️  BFT Status: {'STABLE' if 'bft_safe: True' in result.stdout else 'BREACHED'}"
-    )
+    print(f"🛡️  BFT Status: {'STABLE' if bft_safe else 'BREACHED'}")
 
 
 if __name__ == "__main__":
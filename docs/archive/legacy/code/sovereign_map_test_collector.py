@@ -5,25 +5,87 @@ import json
 import datetime
 import os
 import argparse
+import shutil
 import subprocess
+from typing import Optional
+from xml.sax.saxutils import escape
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps the collector dependency-free
+    orjson = None
+
+
+def _to_builtin(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def _write_json(path: str, payload: dict):
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            )
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, default=_to_builtin)
+
+
+def _link_latest(path: str) -> str:
+    """Point audit_results/latest.<ext> at ``path`` without rewriting it."""
+    latest = os.path.join(os.path.dirname(path), "latest" + os.path.splitext(path)[1])
+    try:
+        if os.path.samefile(path, latest):
+            # A rerun within the same second: os.replace() of a hard link onto
+            # itself is a no-op and would leave the .tmp link behind.
+            return latest
+    except FileNotFoundError:
+        pass
+    tmp = f"{latest}.tmp"
+    try:
+        os.remove(tmp)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, tmp)
+    except OSError:
+        # Filesystems without hard links get a plain copy instead.
+        shutil.copyfile(path, tmp)
+    os.replace(tmp, latest)
+    return latest
 
 
 def load_mega_results(path: str) -> dict:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Mega test output not found: {path}")
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def generate_report(mega_data: dict):
-    timestamp = datetime.datetime.utcnow().isoformat() + "Z"
+def _utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
 
+
+def generate_report(mega_data: dict, now: Optional[datetime.datetime] = None):
+    now = now or _utc_now()
+    timestamp = now.isoformat().replace("+00:00", "Z")
+
+    # Per-round series stay as packed arrays until the JSON/TXT boundary.
+    # float64 keeps the reported values exactly as mega_test wrote them.
+    accuracy = np.asarray(mega_data["accuracy_per_round"], dtype=np.float64)
     conv = {
         "section": "convergence_plot data (rounds 1–25)",
-        "rounds": list(range(1, len(mega_data["accuracy_per_round"]) + 1)),
-        "accuracy_per_round": mega_data["accuracy_per_round"],
+        "rounds": np.arange(1, accuracy.size + 1),
+        "accuracy_per_round": accuracy,
         "breach_round": mega_data["breach_round"],
         "breach_accuracy": mega_data["breach_accuracy"],
         "breach_label": "Byzantine Breach (55.6%)",
@@ -75,48 +137,103 @@ def generate_report(mega_data: dict):
     return summary, conv
 
 
-def save_report(summary: dict, malicious: float):
-    ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+def save_report(summary: dict, malicious: float, ts: Optional[str] = None):
+    ts = ts or _utc_now().strftime("%Y%m%d_%H%M%S")
     os.makedirs("audit_results", exist_ok=True)
 
     base = f"sovereign_test_{ts}_mal{int(malicious*100)}"
 
     json_path = f"audit_results/{base}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    _write_json(json_path, summary)
+    _link_latest(json_path)
 
     txt_path = f"audit_results/{base}.txt"
+    parts = [
+        "SOVEREIGN MAP / MOHAWK PROTO – COLLECTED TEST VALUES\n",
+        "=" * 60 + "\n\n",
+        f"Generated: {summary['timestamp_utc']}\n\n",
+    ]
+    for sec in summary["tests"]:
+        parts.append(f"[{sec['section']}]\n")
+        for k, v in sec.items():
+            if k != "section":
+                parts.append(f"  {k:<28}: {_to_builtin(v)}\n")
+        parts.append("\n")
+    parts.append("[Consistency / Sanity Checks]\n")
+    for k, v in summary["consistency_checks"].items():
+        parts.append(f"  {k:<38}: {'PASS' if v else 'FAIL'}\n")
     with open(txt_path, "w", encoding="utf-8") as f:
-        f.write("SOVEREIGN MAP / MOHAWK PROTO – COLLECTED TEST VALUES\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Generated: {summary['timestamp_utc']}\n\n")
-        for sec in summary["tests"]:
-            f.write(f"[{sec['section']}]\n")
-            for k, v in sec.items():
-                if k != "section":
-                    f.write(f"  {k:<28}: {v}\n")
-            f.write("\n")
-        f.write("[Consistency / Sanity Checks]\n")
-        for k, v in summary["consistency_checks"].items():
-            f.write(f"  {k:<38}: {'PASS' if v else 'FAIL'}\n")
+        f.write("".join(parts))
+    _link_latest(txt_path)
 
     return json_path, txt_path
 
 
-def plot_convergence(conv: dict, malicious: float):
-    ts = datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    path = f"audit_results/convergence_{ts}_mal{int(malicious*100)}.png"
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(conv["rounds"], conv["accuracy_per_round"], "b-o", label="Accuracy")
-    plt.axvline(conv["breach_round"], color="r", ls="--", label=conv["breach_label"])
-    plt.title(f"Convergence – malicious = {malicious:.2%}")
-    plt.xlabel("Round")
-    plt.ylabel("Accuracy (%)")
-    plt.grid(True)
-    plt.legend()
-    plt.savefig(path, dpi=150, bbox_inches="tight")
-    plt.close()
+def render_svg(rounds, acc, breach_round, path: str, title: str = ""):
+    """Write a minimal accuracy-per-round line chart as SVG."""
+    width, height, pad = 500, 300, 40
+    x_lo, x_hi = min(rounds), max(rounds)
+    y_lo, y_hi = min(acc), max(acc)
+    x_span = (x_hi - x_lo) or 1
+    y_span = (y_hi - y_lo) or 1
+
+    def sx(x):
+        return pad + (x - x_lo) * (width - 2 * pad) / x_span
+
+    def sy(y):
+        return height - pad - (y - y_lo) * (height - 2 * pad) / y_span
+
+    points = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in zip(rounds, acc))
+    bx = sx(breach_round)
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}">'
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">'
+        f"{escape(title)}</text>"
+        f'<polyline points="{points}" fill="none" stroke="blue" stroke-width="2"/>'
+        f'<line x1="{bx:.1f}" y1="{pad}" x2="{bx:.1f}" y2="{height - pad}" '
+        f'stroke="red" stroke-dasharray="6,4"/>'
+        "</svg>\n"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(svg)
+
+
+def plot_convergence(
+    conv: dict, malicious: float, png: bool = False, ts: Optional[str] = None
+):
+    ts = ts or _utc_now().strftime("%Y%m%d_%H%M%S")
+    base = f"audit_results/convergence_{ts}_mal{int(malicious*100)}"
+    title = f"Convergence – malicious = {malicious:.2%}"
+
+    if not png:
+        path = f"{base}.svg"
+        render_svg(
+            conv["rounds"],
+            conv["accuracy_per_round"],
+            conv["breach_round"],
+            path,
+            title=title,
+        )
+        _link_latest(path)
+        return path
+
+    # matplotlib is only needed for --png, so keep its import cost off the
+    # default SVG path.
+    from mpl_config import pyplot
+
+    plt = pyplot()
+    path = f"{base}.png"
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(conv["rounds"], conv["accuracy_per_round"], "b-o", label="Accuracy")
+    ax.axvline(conv["breach_round"], color="r", ls="--", label=conv["breach_label"])
+    ax.set_title(title)
+    ax.set_xlabel("Round")
+    ax.set_ylabel("Accuracy (%)")
+    ax.grid(True)
+    ax.legend()
+    fig.savefig(path, dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    _link_latest(path)
     return path
 
 
@@ -127,6 +244,9 @@ def main():
     parser.add_argument(
         "--run-mega", action="store_true", help="Run mega_test.py first"
     )
+    parser.add_argument(
+        "--png", action="store_true", help="Render the plot as PNG via matplotlib"
+    )
     args = parser.parse_args()
 
     if args.run_mega:
@@ -145,9 +265,12 @@ def main():
 
     print("Loading results...")
     mega = load_mega_results(args.mega_output)
-    report, conv = generate_report(mega)
-    json_p, txt_p = save_report(report, args.malicious)
-    plot_p = plot_convergence(conv, args.malicious)
+    # One timestamp per run keeps the report and plot filenames aligned.
+    now = _utc_now()
+    ts = now.strftime("%Y%m%d_%H%M%S")
+    report, conv = generate_report(mega, now)
+    json_p, txt_p = save_report(report, args.malicious, ts=ts)
+    plot_p = plot_convergence(conv, args.malicious, png=args.png, ts=ts)
 
     print("\nGenerated:")
     print(f"  Report JSON: {json_p}")
@@ -11,12 +11,16 @@ Flask backend with:
 """
 
 import json
+import atexit
 import logging
+import queue
 import random
 import threading
 import time
-from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional, Tuple, Union
 
 import ecdsa
 import numpy as np
@@ -25,6 +29,16 @@ from flask import Flask, jsonify, request
 from prometheus_flask_exporter import PrometheusMetrics
 from prometheus_client import Gauge, Counter, Histogram
 
+try:
+    import coincurve
+except ImportError:  # fall back to pure-Python ecdsa signing
+    coincurve = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used for logs and responses instead
+    orjson = None
+
 
 # Configure JSON structured logging
 class JsonFormatter(logging.Formatter):
@@ -41,12 +55,24 @@ class JsonFormatter(logging.Formatter):
             "enclave_access": getattr(record, "enclave_access", None),
             "latency_ns": getattr(record, "latency_ns", None),
         }
-        return json.dumps({k: v for k, v in log_record.items() if v is not None})
+        filtered = {k: v for k, v in log_record.items() if v is not None}
+        if orjson is not None:
+            return orjson.dumps(filtered, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(filtered)
 
 
 handler = logging.StreamHandler()
 handler.setFormatter(JsonFormatter())
-logging.basicConfig(level=logging.INFO, handlers=[handler])
+# Request threads only enqueue records; JSON formatting and the stream write
+# happen on the listener thread.
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+queue_handler = QueueHandler(log_queue)
+# Keep basicConfig from prefixing level/name onto the enqueued message
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -79,6 +105,30 @@ FOUNDERS = [
 ]
 
 
+# Private key type from either signing backend, see generate_signing_key()
+AnySigningKey = Union["coincurve.PrivateKey", SigningKey]
+
+
+def generate_signing_key() -> AnySigningKey:
+    """Create a secp256k1 signing key (coincurve when installed, else ecdsa)."""
+    if coincurve is not None:
+        return coincurve.PrivateKey()
+    return SigningKey.generate(curve=SECP256k1)
+
+
+def public_key_hex(key: AnySigningKey) -> str:
+    """Hex-encode the public half of a key from generate_signing_key()."""
+    if coincurve is not None:
+        return key.public_key.format(compressed=True).hex()
+    return key.verifying_key.to_string().hex()
+
+
+# Seconds between flushes of buffered DAO votes and CXL access metrics
+METRICS_FLUSH_INTERVAL = 0.1
+# Requests flush inline once either buffer reaches this many events
+METRICS_FLUSH_BATCH = 256
+
+
 class MockDAO:
     """
     Decentralized Autonomous Organization for Sovereign Maps governance.
@@ -87,13 +137,24 @@ class MockDAO:
 
     def __init__(self):
         self.founding_signatures = {}
-        self.genesis_key = SigningKey.generate(curve=SECP256k1)
-        self.verifying_key = self.genesis_key.verifying_key
+        self.pending_votes = deque()
+        payloads = [
+            f"{name}|{country}|{address}".encode()
+            for _, name, country, address in FOUNDERS
+        ]
+
+        # Sign each founder. libsecp256k1 (coincurve) releases the GIL, so the
+        # batch spreads across cores; pure-Python ecdsa would not gain from it.
+        self.genesis_key = generate_signing_key()
+        if coincurve is not None:
+            self.verifying_key = self.genesis_key.public_key
+            with ThreadPoolExecutor() as pool:
+                sigs = list(pool.map(self.genesis_key.sign, payloads))
+        else:
+            self.verifying_key = self.genesis_key.verifying_key
+            sigs = [self.genesis_key.sign(data) for data in payloads]
 
-        # Sign each founder
-        for founder_id, name, country, address in FOUNDERS:
-            data = f"{name}|{country}|{address}".encode()
-            sig = self.genesis_key.sign(data)
+        for (founder_id, name, country, address), sig in zip(FOUNDERS, sigs):
             self.founding_signatures[name] = {
                 "signature": sig.hex(),
                 "founder_id": founder_id,
@@ -101,12 +162,22 @@ class MockDAO:
                 "address": address,
             }
 
+        # Signatures never change after init, so verify each one once here
+        # and answer verify_founder() from the cached set.
+        self.verified_founders = frozenset(
+            name for name in self.founding_signatures if self._check_signature(name)
+        )
+
         logger.info(
             f"DAO initialized with {len(self.founding_signatures)} founding signatures"
         )
 
     def verify_founder(self, name: str) -> bool:
         """Verify a founder's signature."""
+        return name in self.verified_founders
+
+    def _check_signature(self, name: str) -> bool:
+        """Run the full signature check for one founder."""
         if name not in self.founding_signatures:
             return False
 
@@ -114,6 +185,12 @@ class MockDAO:
         sig = bytes.fromhex(founder_data["signature"])
         data = f"{name}|{founder_data['country']}|{founder_data['address']}".encode()
 
+        if coincurve is not None:
+            try:
+                return self.verifying_key.verify(sig, data)
+            except ValueError:  # malformed DER signature
+                return False
+
         try:
             self.verifying_key.verify(sig, data)
             return True
@@ -125,13 +202,25 @@ class MockDAO:
         return self.founding_signatures.get(name)
 
     def vote_proposal(self, proposal_id: str, voter_name: str, vote: bool) -> bool:
-        """Record a governance vote (simplified)."""
-        if not self.verify_founder(voter_name):
+        """Accept a governance vote (simplified); recorded by flush_votes()."""
+        if voter_name not in self.verified_founders:
             return False
-        # In production: record on-chain
-        logger.info(f"Vote recorded: {voter_name} voted {vote} on {proposal_id}")
+        self.pending_votes.append((proposal_id, voter_name, vote))
         return True
 
+    def flush_votes(self) -> int:
+        """Record all buffered votes in one go and return how many there were."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.pending_votes.popleft())
+            except IndexError:  # drained, possibly by a concurrent flush
+                break
+        if batch:
+            # In production: record on-chain
+            logger.info("Votes recorded: %s", batch)
+        return len(batch)
+
 
 # ============================================================================
 # NEURAL NETWORK MODEL
@@ -145,38 +234,51 @@ class SimpleNeuralModel:
         self.input_dim = input_dim
         self.hidden_dim = hidden_dim
         self.output_dim = output_dim
-
-        # Initialize weights
-        self.W1 = np.random.randn(input_dim, hidden_dim) * 0.01
-        self.b1 = np.zeros(hidden_dim)
-        self.W2 = np.random.randn(hidden_dim, output_dim) * 0.01
-        self.b2 = np.zeros(output_dim)
+        # All parameters share one contiguous float32 buffer; W1/b1/W2/b2 are
+        # views into it, so get_weights/set_weights never concatenate or
+        # reshape. float32 halves the bytes moved per matmul and per update.
+        w1_end = input_dim * hidden_dim
+        b1_end = w1_end + hidden_dim
+        w2_end = b1_end + hidden_dim * output_dim
+        self.num_params = w2_end + output_dim
+        self._flat = np.zeros(self.num_params, dtype=np.float32)
+        self.W1 = self._flat[:w1_end].reshape(input_dim, hidden_dim)
+        self.b1 = self._flat[w1_end:b1_end]
+        self.W2 = self._flat[b1_end:w2_end].reshape(hidden_dim, output_dim)
+        self.b2 = self._flat[w2_end:]
+        self.offsets = (w1_end, b1_end, w2_end)
+
+        # Initialize weights (biases stay zero)
+        self.W1[...] = np.random.randn(input_dim, hidden_dim) * 0.01
+        self.W2[...] = np.random.randn(hidden_dim, output_dim) * 0.01
+        self.Z1 = self.A1 = self.Z2 = None
 
     def forward(self, X):
-        self.Z1 = X @ self.W1 + self.b1
-        self.A1 = np.maximum(0, self.Z1)  # ReLU
-        self.Z2 = self.A1 @ self.W2 + self.b2
+        # Activations live in buffers reused across calls with the same batch
+        # size; bias add and ReLU run in place instead of allocating temporaries.
+        # The returned array is overwritten by the next forward().
+        if self.Z1 is None or self.Z1.shape[0] != X.shape[0]:
+            self.Z1 = np.empty((X.shape[0], self.hidden_dim), dtype=np.float32)
+            self.Z2 = np.empty((X.shape[0], self.output_dim), dtype=np.float32)
+        np.matmul(X, self.W1, out=self.Z1)
+        self.Z1 += self.b1
+        self.A1 = np.maximum(self.Z1, 0, out=self.Z1)  # ReLU
+        np.matmul(self.A1, self.W2, out=self.Z2)
+        self.Z2 += self.b2
         return self.Z2
 
-    def get_weights(self):
-        return np.concatenate(
-            [self.W1.flatten(), self.b1.flatten(), self.W2.flatten(), self.b2.flatten()]
-        )
-
-    def set_weights(self, weights):
-        idx = 0
-        size = self.input_dim * self.hidden_dim
-        self.W1 = weights[idx : idx + size].reshape(self.input_dim, self.hidden_dim)
-        idx += size
-
-        self.b1 = weights[idx : idx + self.hidden_dim]
-        idx += self.hidden_dim
+    def get_weights(self, out: Optional[np.ndarray] = None):
+        """Return the flat parameter vector.
 
-        size = self.hidden_dim * self.output_dim
-        self.W2 = weights[idx : idx + size].reshape(self.hidden_dim, self.output_dim)
-        idx += size
+        Without ``out`` this is the model's own buffer, not a copy.
+        """
+        if out is None:
+            return self._flat
+        np.copyto(out, self._flat)
+        return out
 
-        self.b2 = weights[idx:]
+    def set_weights(self, weights):
+        np.copyto(self._flat, weights)
 
 
 # ============================================================================
@@ -184,6 +286,16 @@ class SimpleNeuralModel:
 # ============================================================================
 
 
+# Memory accesses kept in CXLPool.access_log / used for the HUD latency average
+ACCESS_LOG_LEN = 1024
+HUD_LATENCY_WINDOW = 100
+# Simulated access latencies / integrity outcomes drawn per refill
+SAMPLE_BUFFER_LEN = 4096
+# Actually sleep off simulated access latency (coalesced into >= 1 ms sleeps);
+# off by default since the latency is already reported per access
+SIMULATE_ACCESS_SLEEP = False
+
+
 class CXLPool:
     """
     CXL 3.2 memory pool with CHMU (Cache Hierarchy Management Unit) tiering.
@@ -195,7 +307,17 @@ class CXLPool:
         self.cxl_version = cxl_version
         self.allocations = defaultdict(float)
         self.enclaves = {}
-        self.access_log = []
+        self.access_log = deque(maxlen=ACCESS_LOG_LEN)
+        self.recent_latencies = deque(maxlen=HUD_LATENCY_WINDOW)
+        # Simulated latency not yet slept off (see access_memory); request
+        # threads update it under _sleep_lock
+        self._pending_sleep_ns = 0.0
+        self._sleep_lock = threading.Lock()
+
+        # Per-access randomness is drawn in batches from one Generator
+        self._rng = np.random.default_rng()
+        self._sample_lock = threading.Lock()
+        self._refill_samples()
 
         # CXL 3.2 CHMU tiering benefits
         if cxl_version == "3.2":
@@ -210,22 +332,41 @@ class CXLPool:
             f"tiering factor {self.tiering_factor}"
         )
 
+    def _refill_samples(self):
+        # Lists rather than arrays: indexing yields plain Python scalars
+        self._latency_samples = self._rng.uniform(100, 200, SAMPLE_BUFFER_LEN).tolist()
+        self._integrity_failures = (
+            self._rng.random(SAMPLE_BUFFER_LEN) < 0.05  # 5% failure rate
+        ).tolist()
+        self._sample_idx = 0
+
+    def _next_sample(self) -> Tuple[float, bool]:
+        """Return (base latency in ns, integrity failure) for one access."""
+        with self._sample_lock:
+            if self._sample_idx == SAMPLE_BUFFER_LEN:
+                self._refill_samples()
+            i = self._sample_idx
+            self._sample_idx += 1
+            return self._latency_samples[i], self._integrity_failures[i]
+
     def create_enclave(
-        self, owner_id: int, owner_key: SigningKey, size_gb: float
+        self, owner_id: int, owner_key: AnySigningKey, size_gb: float
     ) -> Optional[int]:
         """Create a TSP-secured memory enclave."""
         available = self.total_ram - sum(self.allocations.values())
 
         if available < size_gb:
             logger.warning(
-                f"Insufficient CXL memory: {available:.2f}GB available, {size_gb:.2f}GB requested"
+                "Insufficient CXL memory: %.2fGB available, %.2fGB requested",
+                available,
+                size_gb,
             )
             return None
 
         enclave_id = len(self.enclaves)
 
         # TSP security: store owner's public key
-        owner_pubkey = owner_key.verifying_key.to_string().hex()
+        owner_pubkey = public_key_hex(owner_key)
 
         self.enclaves[enclave_id] = {
             "owner": owner_id,
@@ -238,14 +379,17 @@ class CXLPool:
         self.allocations[enclave_id] = size_gb
 
         logger.info(
-            f"Enclave {enclave_id} created by node {owner_id}: {size_gb:.2f}GB",
+            "Enclave %s created by node %s: %.2fGB",
+            enclave_id,
+            owner_id,
+            size_gb,
             extra={"enclave_id": enclave_id, "size_gb": size_gb},
         )
 
         return enclave_id
 
     def grant_access(
-        self, enclave_id: int, granter_key: SigningKey, new_node_id: int
+        self, enclave_id: int, granter_key: AnySigningKey, new_node_id: int
     ) -> bool:
         """Grant another node access to an enclave (with signature verification)."""
         if enclave_id not in self.enclaves:
@@ -254,17 +398,19 @@ class CXLPool:
         enclave = self.enclaves[enclave_id]
 
         # Verify granter owns the enclave
-        granter_pubkey = granter_key.verifying_key.to_string().hex()
+        granter_pubkey = public_key_hex(granter_key)
         if granter_pubkey != enclave["owner_pubkey"]:
-            logger.warning(f"Access grant denied: wrong owner for enclave {enclave_id}")
+            logger.warning(
+                "Access grant denied: wrong owner for enclave %s", enclave_id
+            )
             return False
 
         enclave["permitted"].add(new_node_id)
-        logger.info(f"Access granted: node {new_node_id} → enclave {enclave_id}")
+        logger.info("Access granted: node %s → enclave %s", new_node_id, enclave_id)
         return True
 
     def access_memory(
-        self, node_id: int, node_key: SigningKey, enclave_id: int, operation="read"
+        self, node_id: int, node_key: AnySigningKey, enclave_id: int, operation="read"
     ) -> Tuple[bool, str, float]:
         """
         Access memory with CXL 3.2 CHMU tiering optimization.
@@ -278,21 +424,31 @@ class CXLPool:
         # Check permissions
         if node_id not in enclave["permitted"]:
             logger.warning(
-                f"Unauthorized access attempt: node {node_id} → enclave {enclave_id}"
+                "Unauthorized access attempt: node %s → enclave %s", node_id, enclave_id
             )
             return False, "Unauthorized", 0.0
 
         # CXL 3.2 CHMU tiering: reduced latency
-        base_latency = random.uniform(100, 200)  # nanoseconds
+        base_latency, integrity_failure = self._next_sample()  # nanoseconds
         optimized_latency = base_latency * self.tiering_factor
 
-        # Simulate memory access
-        time.sleep(optimized_latency / 1e9)
+        # Simulate memory access. time.sleep cannot resolve ~100 ns (it blocks
+        # for ~1 ms or more), so accumulate the simulated latency and sleep it
+        # off in one go once a full millisecond has built up.
+        if SIMULATE_ACCESS_SLEEP:
+            sleep_ns = 0.0
+            with self._sleep_lock:
+                self._pending_sleep_ns += optimized_latency
+                if self._pending_sleep_ns >= 1_000_000:
+                    sleep_ns, self._pending_sleep_ns = self._pending_sleep_ns, 0.0
+            # Sleep outside the lock so other requests keep accumulating
+            if sleep_ns:
+                time.sleep(sleep_ns / 1e9)
 
         # TSP integrity check (5% failure rate for realism)
-        if random.random() < 0.05:
+        if integrity_failure:
             logger.error(
-                f"TSP integrity check failed: node {node_id}, enclave {enclave_id}"
+                "TSP integrity check failed: node %s, enclave %s", node_id, enclave_id
             )
             return False, "TSP integrity failure", optimized_latency
 
@@ -305,9 +461,13 @@ class CXLPool:
                 "timestamp": time.time(),
             }
         )
+        self.recent_latencies.append(optimized_latency)
 
         logger.info(
-            f"Memory access: node {node_id} {operation} enclave {enclave_id}",
+            "Memory access: node %s %s enclave %s",
+            node_id,
+            operation,
+            enclave_id,
             extra={"latency_ns": optimized_latency, "enclave_access": "success"},
         )
 
@@ -323,28 +483,89 @@ class CXLPool:
 # ============================================================================
 
 
+_update_buf: Optional[np.ndarray] = None
+# Scratch rows for stacking list inputs in stake_weighted_trimmed_mean. Kept
+# apart from _update_buf because those inputs may be views into it, and
+# copying them back in any other order would overwrite rows not yet read.
+_stack_buf: Optional[np.ndarray] = None
+
+
+def _reusable_rows(
+    buf: Optional[np.ndarray], num_nodes: int, num_params: int
+) -> np.ndarray:
+    if buf is None or buf.shape[0] < num_nodes or buf.shape[1] != num_params:
+        buf = np.empty((num_nodes, num_params), dtype=np.float32)
+    return buf
+
+
+def _update_buffer(num_nodes: int, num_params: int) -> np.ndarray:
+    """Return a reusable (num_nodes, num_params) matrix for round updates."""
+    global _update_buf
+
+    _update_buf = _reusable_rows(_update_buf, num_nodes, num_params)
+    return _update_buf[:num_nodes]
+
+
+def _stack_buffer(num_nodes: int, num_params: int) -> np.ndarray:
+    """Return reusable scratch rows for stacking aggregation inputs."""
+    global _stack_buf
+
+    _stack_buf = _reusable_rows(_stack_buf, num_nodes, num_params)
+    return _stack_buf[:num_nodes]
+
+
 def stake_weighted_trimmed_mean(
-    updates: List[Dict], trim_fraction: float = 0.2
+    updates: List[Dict],
+    trim_fraction: float = 0.2,
+    stacked: Optional[np.ndarray] = None,
+    stakes: Optional[np.ndarray] = None,
 ) -> Optional[np.ndarray]:
     """
     Byzantine-resistant aggregation with stake weighting (FIXED VERSION).
+
+    ``stacked`` may be passed when the update weights already live as the
+    rows of one (N, D) array, which skips re-stacking them; likewise
+    ``stakes`` when the per-update stakes are already one (N,) array.
     """
     if len(updates) < 2:
         return None
 
-    stakes = np.array([u["stake"] for u in updates])
+    if stakes is None:
+        stakes = np.array([u["stake"] for u in updates])
     contribs = np.array([u.get("contribution_score", 1.0) for u in updates])
-    weights_list = [u["weights"] for u in updates]
 
     weights = stakes * contribs
     if weights.sum() <= 0:
         return None
 
-    norm_weights = weights / weights.sum()
-    stacked = np.stack(weights_list, axis=0)
-
-    # Use median for Byzantine resistance
-    aggregated = np.median(stacked, axis=0)
+    norm_weights = (weights / weights.sum()).astype(np.float32)
+    if stacked is None:
+        # Reuse scratch rows instead of np.stack allocating a new matrix
+        stacked = _stack_buffer(len(updates), np.size(updates[0]["weights"]))
+        for row, u in zip(stacked, updates):
+            np.copyto(row, u["weights"])
+    stacked = stacked.astype(np.float32, copy=False)
+
+    # Coordinate-wise trimmed mean: drop the k lowest and k highest values of
+    # every coordinate, then stake-weight what is left.  argpartition only
+    # has to place the two cut points, so no full sort is needed.
+    n = stacked.shape[0]
+    k = min(int(trim_fraction * n), (n - 1) // 2)
+    order = np.argpartition(stacked, [k, n - k - 1], axis=0)
+    kept = order[k : n - k]
+    values = np.take_along_axis(stacked, kept, axis=0)
+    kept_weights = norm_weights[kept]
+
+    # Where every kept update has zero stake, fall back to the unweighted
+    # trimmed mean rather than pushing NaN to every node.
+    kept_total = kept_weights.sum(axis=0)
+    aggregated = values.mean(axis=0)
+    np.divide(
+        (values * kept_weights).sum(axis=0),
+        kept_total,
+        out=aggregated,
+        where=kept_total > 0,
+    )
 
     return aggregated
 
@@ -354,6 +575,15 @@ def stake_weighted_trimmed_mean(
 # ============================================================================
 
 
+# Rounds of stake history kept per node; older entries are dropped
+STAKE_HISTORY_LEN = 1000
+
+# Local training passes per FL round, and FL rounds per aggregation (FedAvg's
+# tau); with AGGREGATION_INTERVAL = 1 every round aggregates
+LOCAL_STEPS = 3
+AGGREGATION_INTERVAL = 1
+
+
 class SovereignMapNode:
     """Node in the Sovereign Maps neural mesh."""
 
@@ -361,55 +591,129 @@ class SovereignMapNode:
         self, node_id: int, initial_stake: float = 1000.0, ram_capacity: float = 4.0
     ):
         self.id = node_id
-        self.stake = initial_stake
+        # One-element view; initialize_system points it into node_stakes
+        self._stake = np.array([initial_stake], dtype=np.float64)
         self.contribution_score = 1.0
 
         # Neural model
         self.local_model = SimpleNeuralModel(input_dim=10, output_dim=2)
 
         # Spatial data (mock)
-        self.spatial_data = np.random.randn(100, 10)
+        self.spatial_data = np.random.randn(100, 10).astype(np.float32)
 
         # Resource management
         self.ram_usage = random.uniform(1, ram_capacity)
         self.ram_capacity = ram_capacity
 
         # TSP security
-        self.enclave_key = SigningKey.generate(curve=SECP256k1)
+        self.enclave_key = generate_signing_key()
 
         # Metrics
-        self.stake_history = [initial_stake]
+        self.stake_history = deque([initial_stake], maxlen=STAKE_HISTORY_LEN)
 
-    def train_local_ano(self) -> np.ndarray:
-        """Train local model (ANO federated learning)."""
+    def train_local_ano(
+        self, out: Optional[np.ndarray] = None, local_steps: int = LOCAL_STEPS
+    ) -> np.ndarray:
+        """Train local model (ANO federated learning).
+
+        When ``out`` is given the weights are written into it and it is
+        returned, so callers can collect updates without extra copies.
+        """
         # Simple training simulation
         X = self.spatial_data
         y = np.random.randn(100, 2)
 
-        for _ in range(3):
+        for _ in range(local_steps):
             # Forward pass
             pred = self.local_model.forward(X)
             # Backward pass would go here (simplified)
 
-        return self.local_model.get_weights()
+        return self.local_model.get_weights(out=out)
+
+    @property
+    def stake(self) -> float:
+        return float(self._stake[0])
+
+    def bind_stake(self, slot: np.ndarray):
+        """Keep this node's stake in ``slot`` (a 1-element view) from now on."""
+        slot[0] = self._stake[0]
+        self._stake = slot
 
     def update_stake(self, reward: float):
         """Update stake based on participation reward."""
-        self.stake += reward
-        self.stake = max(0, self.stake)
+        self._stake[0] = max(0.0, self._stake[0] + reward)
         self.stake_history.append(self.stake)
 
         logger.info(
-            f"Node {self.id} stake updated to {self.stake:.2f}",
+            "Node %s stake updated to %.2f",
+            self.id,
+            self.stake,
             extra={"node_id": self.id, "stake": self.stake},
         )
 
 
+def train_local_ano_batch(
+    nodes: List[SovereignMapNode],
+    X: np.ndarray,
+    out: np.ndarray,
+    local_steps: int = LOCAL_STEPS,
+) -> np.ndarray:
+    """Train every node's local model in one batched pass (ANO).
+
+    All nodes share the SimpleNeuralModel architecture, so each node's weights
+    are copied into its row of ``out`` and the forward passes run as one
+    batched matmul per layer over ``X`` (num_nodes, samples, input_dim)
+    instead of one small matmul per node. Returns ``out``.
+    """
+    model = nodes[0].local_model
+    w1_end, b1_end, w2_end = model.offsets
+    n = len(nodes)
+
+    for row, node in zip(out, nodes):
+        node.local_model.get_weights(out=row)
+
+    # Per-node layer parameters as views into the rows of ``out``
+    W1 = out[:, :w1_end].reshape(n, model.input_dim, model.hidden_dim)
+    b1 = out[:, None, w1_end:b1_end]
+    W2 = out[:, b1_end:w2_end].reshape(n, model.hidden_dim, model.output_dim)
+    b2 = out[:, None, w2_end:]
+
+    for _ in range(local_steps):
+        # Forward pass
+        Z1 = np.matmul(X, W1)
+        Z1 += b1
+        np.maximum(Z1, 0, out=Z1)  # ReLU
+        pred = np.matmul(Z1, W2)
+        pred += b2
+        # Backward pass would go here (simplified)
+
+    return out
+
+
 # ============================================================================
 # FLASK APPLICATION
 # ============================================================================
 
 app = Flask(__name__)
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Serve jsonify() responses through orjson (NumPy values included)."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 metrics = PrometheusMetrics(app, group_by="endpoint")
 
 # Prometheus metrics
@@ -433,16 +737,82 @@ enclave_access_total = Counter(
 )
 dao_votes_total = Counter("sovereignmap_dao_votes_total", "DAO governance votes")
 
+# (result, operation, latency_ns) per /cxl/access, drained by
+# flush_access_metrics() so requests never touch the Prometheus locks
+access_events = deque()
+
+
+def flush_access_metrics() -> int:
+    """Apply buffered /cxl/access events to Prometheus; returns the count."""
+    counts = defaultdict(int)
+    latencies = []
+    while True:
+        try:
+            result, operation, latency = access_events.popleft()
+        except IndexError:  # drained, possibly by a concurrent flush
+            break
+        counts[result, operation] += 1
+        latencies.append(latency)
+    for (result, operation), n in counts.items():
+        enclave_access_total.labels(result=result, operation=operation).inc(n)
+    for latency in latencies:
+        cxl_latency_histogram.observe(latency)
+    return len(latencies)
+
+
+def flush_metrics() -> None:
+    """Record buffered DAO votes and CXL access events."""
+    if dao is not None:
+        dao_votes_total.inc(dao.flush_votes())
+    flush_access_metrics()
+
+
+def _flush_if_full() -> None:
+    # Keeps both buffers bounded even if no flusher thread is running.
+    pending_votes = len(dao.pending_votes) if dao is not None else 0
+    if max(pending_votes, len(access_events)) >= METRICS_FLUSH_BATCH:
+        flush_metrics()
+
+
+_metrics_thread: Optional[threading.Thread] = None
+
+
+def _start_metrics_flusher() -> None:
+    """Start the periodic metrics flusher once per process."""
+    global _metrics_thread
+    if _metrics_thread is not None and _metrics_thread.is_alive():
+        return
+
+    def background_metrics():
+        while True:
+            time.sleep(METRICS_FLUSH_INTERVAL)
+            flush_metrics()
+
+    _metrics_thread = threading.Thread(target=background_metrics, daemon=True)
+    _metrics_thread.start()
+
+
 # Global state
 nodes: List[SovereignMapNode] = []
 cxl_pool: CXLPool = None
 dao: MockDAO = None
 fl_round_number = 0
+node_spatial_data: Optional[np.ndarray] = None
+# Every node's stake in one array (SoA); nodes hold views into it
+node_stakes: Optional[np.ndarray] = None
+fl_round_lock = threading.Lock()
+# Running total of node stakes, kept in step with update_stake() calls
+stake_total = 0.0
+
+
+def average_stake() -> float:
+    """Mean node stake, from the running total."""
+    return stake_total / len(nodes) if nodes else 0.0
 
 
 def initialize_system(num_nodes: int = 10):
     """Initialize the Sovereign Maps system."""
-    global nodes, cxl_pool, dao
+    global nodes, cxl_pool, dao, node_spatial_data, node_stakes, stake_total
 
     # Create DAO
     dao = MockDAO()
@@ -456,6 +826,19 @@ def initialize_system(num_nodes: int = 10):
         for i in range(num_nodes)
     ]
 
+    # Stack every node's spatial data once so FL rounds can train all nodes
+    # in one batched pass; each node keeps a view of its own slice.
+    node_spatial_data = np.stack([n.spatial_data for n in nodes])
+    for node, data in zip(nodes, node_spatial_data):
+        node.spatial_data = data
+
+    node_stakes = np.array([n.stake for n in nodes], dtype=np.float64)
+    for i, node in enumerate(nodes):
+        node.bind_stake(node_stakes[i : i + 1])
+    stake_total = float(node_stakes.sum())
+
+    _start_metrics_flusher()
+
     logger.info(
         f"System initialized: {num_nodes} nodes, CXL 3.2 pool, {len(FOUNDERS)} DAO founders"
     )
@@ -485,7 +868,9 @@ def get_founders():
         }
         for fid, name, country, address in FOUNDERS[:20]  # Return first 20
     ]
-    return jsonify({"founders": founders_list, "total": len(FOUNDERS)})
+    response = jsonify({"founders": founders_list, "total": len(FOUNDERS)})
+    response.headers["Cache-Control"] = "max-age=60"
+    return response
 
 
 @app.route("/dao/vote", methods=["POST"])
@@ -496,10 +881,9 @@ def dao_vote():
     voter_name = data.get("voter_name")
     vote = data.get("vote", True)
 
+    # Accepted votes are counted in dao_votes_total when they are flushed
     success = dao.vote_proposal(proposal_id, voter_name, vote)
-
-    if success:
-        dao_votes_total.inc()
+    _flush_if_full()
 
     return jsonify({"success": success, "proposal_id": proposal_id})
 
@@ -507,61 +891,73 @@ def dao_vote():
 @app.route("/fl_round", methods=["POST"])
 def fl_round():
     """Execute a federated learning round."""
-    global fl_round_number
-
-    start_time = time.time()
-    fl_round_number += 1
-
-    # Collect updates from nodes
-    updates = []
-    for node in nodes:
-        weights = node.train_local_ano()
-        updates.append(
+    global fl_round_number, stake_total
+
+    # The background thread and HTTP requests can both trigger a round; they
+    # share the update buffer and stake totals, so run one at a time.
+    with fl_round_lock:
+        start_time = time.time()
+        fl_round_number += 1
+
+        # Train all nodes together; each update lands in its own row of buf
+        buf = _update_buffer(len(nodes), nodes[0].local_model.num_params)
+        train_local_ano_batch(nodes, node_spatial_data, out=buf)
+        updates = [
             {
                 "node_id": node.id,
-                "weights": weights,
+                "weights": buf[i],
                 "stake": node.stake,
                 "contribution_score": node.contribution_score,
             }
-        )
+            for i, node in enumerate(nodes)
+        ]
+
+        # Aggregate every AGGREGATION_INTERVAL rounds; in between, nodes keep
+        # training from their own local weights
+        aggregated = None
+        if fl_round_number % AGGREGATION_INTERVAL == 0:
+            aggregated = stake_weighted_trimmed_mean(
+                updates, stacked=buf, stakes=node_stakes
+            )
 
-    # Aggregate
-    aggregated = stake_weighted_trimmed_mean(updates)
+        # Apply to all nodes
+        if aggregated is not None:
+            for node in nodes:
+                node.local_model.set_weights(aggregated)
 
-    # Apply to all nodes
-    if aggregated is not None:
+        # Distribute rewards
         for node in nodes:
-            node.local_model.set_weights(aggregated)
+            reward = 50 + random.uniform(-10, 10)
+            before = node.stake
+            node.update_stake(reward)
+            stake_total += node.stake - before
 
-    # Distribute rewards
-    for node in nodes:
-        reward = 50 + random.uniform(-10, 10)
-        node.update_stake(reward)
+        # Update metrics
+        duration = time.time() - start_time
+        fl_rounds_total.inc()
+        fl_round_duration.observe(duration)
 
-    # Update metrics
-    duration = time.time() - start_time
-    fl_rounds_total.inc()
-    fl_round_duration.observe(duration)
+        avg_stake = average_stake()
+        total_stake = stake_total
+        avg_stake_gauge.set(avg_stake)
+        total_stake_gauge.set(total_stake)
 
-    avg_stake = np.mean([n.stake for n in nodes])
-    total_stake = sum(n.stake for n in nodes)
-    avg_stake_gauge.set(avg_stake)
-    total_stake_gauge.set(total_stake)
-
-    logger.info(
-        f"FL round {fl_round_number} completed",
-        extra={"fl_round": fl_round_number, "duration": duration},
-    )
+        logger.info(
+            "FL round %d completed",
+            fl_round_number,
+            extra={"fl_round": fl_round_number, "duration": duration},
+        )
 
-    return jsonify(
-        {
-            "round": fl_round_number,
-            "participants": len(updates),
-            "avg_stake": avg_stake,
-            "total_stake": total_stake,
-            "duration": duration,
-        }
-    )
+        return jsonify(
+            {
+                "round": fl_round_number,
+                "participants": len(updates),
+                "aggregated": aggregated is not None,
+                "avg_stake": avg_stake,
+                "total_stake": total_stake,
+                "duration": duration,
+            }
+        )
 
 
 @app.route("/hud_data", methods=["GET"])
@@ -574,10 +970,8 @@ def hud_data():
         return jsonify({"error": "System not initialized"}), 503
 
     # Calculate real-time metrics
-    recent_accesses = cxl_pool.access_log[-100:] if cxl_pool.access_log else []
-    avg_latency = (
-        np.mean([a["latency_ns"] for a in recent_accesses]) if recent_accesses else 0
-    )
+    recent_latencies = cxl_pool.recent_latencies
+    avg_latency = np.mean(recent_latencies) if recent_latencies else 0
 
     data = {
         "latency_ns": avg_latency,
@@ -586,7 +980,7 @@ def hud_data():
         "mesh_nodes": len(nodes),
         "active_enclaves": len(cxl_pool.enclaves),
         "cxl_utilization": cxl_pool.get_utilization(),
-        "avg_stake": np.mean([n.stake for n in nodes]),
+        "avg_stake": average_stake(),
         "fl_round": fl_round_number,
     }
 
@@ -605,14 +999,14 @@ def voice_query():
     if "scan" in query.lower():
         response = f"Mesh scan complete: {len(nodes)} nodes active, no threats detected"
     elif "stake" in query.lower():
-        avg = np.mean([n.stake for n in nodes])
+        avg = average_stake()
         response = f"Average network stake: {avg:.2f}"
     elif "enclave" in query.lower():
         response = f"Active secure enclaves: {len(cxl_pool.enclaves)}"
     else:
         response = f"Query processed: '{query}' - mesh status nominal"
 
-    logger.info(f"Voice query processed: {query}")
+    logger.info("Voice query processed: %s", query)
 
     return jsonify({"query": query, "response": response, "timestamp": time.time()})
 
@@ -661,10 +1055,10 @@ def access_enclave():
         node_id, node.enclave_key, enclave_id, operation
     )
 
-    # Update metrics
+    # Update metrics (applied in batches by flush_access_metrics)
     result = "success" if success else "failure"
-    enclave_access_total.labels(result=result, operation=operation).inc()
-    cxl_latency_histogram.observe(latency)
+    access_events.append((result, operation, latency))
+    _flush_if_full()
 
     return jsonify(
         {
@@ -679,13 +1073,13 @@ def access_enclave():
 @app.route("/metrics_summary", methods=["GET"])
 def metrics_summary():
     """Get comprehensive system metrics."""
-    return jsonify(
+    response = jsonify(
         {
             "nodes": {
                 "total": len(nodes),
-                "avg_stake": np.mean([n.stake for n in nodes]),
-                "total_stake": sum(n.stake for n in nodes),
-                "stake_distribution": [n.stake for n in nodes],
+                "avg_stake": average_stake(),
+                "total_stake": stake_total,
+                "stake_distribution": node_stakes.tolist(),
             },
             "cxl": {
                 "version": cxl_pool.cxl_version,
@@ -700,20 +1094,30 @@ def metrics_summary():
             },
             "dao": {
                 "total_founders": len(FOUNDERS),
-                "verified_founders": sum(
-                    1 for _, name, _, _ in FOUNDERS if dao.verify_founder(name)
-                ),
+                "verified_founders": len(dao.verified_founders),
             },
         }
     )
+    # Values only move once per FL round; let pollers reuse them briefly
+    response.headers["Cache-Control"] = "max-age=1"
+    return response
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
-if __name__ == "__main__":
-    initialize_system(num_nodes=10)
+
+def create_app(num_nodes: int = 10) -> Flask:
+    """
+    Initialize the system (which starts metric flushing) and background FL rounds.
+    Entry point for WSGI servers, e.g.:
+
+        gunicorn -w 1 --threads 8 "sovereignmap_production_backend:create_app()"
+
+    All state is in-process, so scale with threads rather than workers.
+    """
+    initialize_system(num_nodes=num_nodes)
 
     # Start background FL rounds (optional)
     def background_fl():
@@ -725,5 +1129,11 @@ if __name__ == "__main__":
     fl_thread = threading.Thread(target=background_fl, daemon=True)
     fl_thread.start()
 
+    return app
+
+
+if __name__ == "__main__":
+    create_app(num_nodes=10)
+
     logger.info("Sovereign Maps backend starting on port 5000")
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
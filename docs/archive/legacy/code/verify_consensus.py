@@ -1,6 +1,6 @@
 import json
-import numpy as np
 import os
+import statistics
 
 
 def monitor_live_convergence(file_path="./Live_100_Node/live_stats.json"):
@@ -17,10 +17,10 @@ def monitor_live_convergence(file_path="./Live_100_Node/live_stats.json"):
         if "history" not in data or len(data["history"]) < 5:
             return "CONVERGING"
 
-        recent_acc = [r["accuracy"] for r in data["history"]][-5:]
+        recent_acc = [r["accuracy"] for r in data["history"][-5:]]
 
         # Calculate variance (Standard Deviation squared)
-        std_dev = np.std(recent_acc)
+        std_dev = statistics.pstdev(recent_acc)
 
         # If variance is < 0.001 for 5 rounds, we have plateaued
         if std_dev < 0.001:
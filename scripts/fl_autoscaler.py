@@ -2,7 +2,9 @@
 """Simple FL autoscaler for docker-compose based testnet.
 
 Scales `node-agent` replicas based on FL round throughput and participant count.
-Run this on the host with Docker access.
+Run this on the host with Docker access. With the optional `docker` SDK
+installed (see requirements.txt) and a Swarm manager daemon, the Swarm service
+is scaled in place instead of through `docker compose`.
 """
 
 from __future__ import annotations
@@ -14,6 +16,11 @@ import time
 import urllib.parse
 import urllib.request
 
+try:
+    import docker
+except ImportError:  # compose CLI remains the default path
+    docker = None
+
 PROM_URL = os.getenv("PROMETHEUS_URL", "http://localhost:9090")
 COMPOSE_FILE = os.getenv("COMPOSE_FILE", "docker-compose.full.yml")
 SCALE_TARGET = os.getenv("SCALE_SERVICE", "node-agent")
@@ -21,6 +28,12 @@ MIN_REPLICAS = int(os.getenv("MIN_REPLICAS", "5"))
 MAX_REPLICAS = int(os.getenv("MAX_REPLICAS", "30"))
 LOOP_SECONDS = int(os.getenv("AUTOSCALE_INTERVAL_SECONDS", "30"))
 TARGET_ROUNDS_PER_MIN = float(os.getenv("TARGET_ROUNDS_PER_MIN", "1.0"))
+# Swarm stacks prefix service names (e.g. "sovereign_node-agent").
+SWARM_SERVICE = os.getenv("SWARM_SERVICE", SCALE_TARGET)
+
+_docker_client = None
+# Set once the daemon has been checked, so compose hosts probe it only once
+_swarm_checked = False
 
 
 def prom_query(expr: str) -> float:
@@ -35,6 +48,14 @@ def prom_query(expr: str) -> float:
 
 
 def current_replicas() -> int:
+    client = _swarm_client()
+    if client is not None:
+        # Read the same service scale_to() adjusts, not the compose project.
+        try:
+            service = client.services.get(SWARM_SERVICE)
+            return int(service.attrs["Spec"]["Mode"]["Replicated"]["Replicas"])
+        except (docker.errors.DockerException, KeyError) as exc:
+            print(f"[autoscaler] swarm replica read failed ({exc}); using compose")
     cmd = [
         "docker",
         "compose",
@@ -49,8 +70,40 @@ def current_replicas() -> int:
     return sum(1 for line in out.splitlines() if line.strip() == SCALE_TARGET)
 
 
+def _swarm_client():
+    """Return a cached Docker SDK client when the daemon is a Swarm manager."""
+    global _docker_client, _swarm_checked
+    if docker is None or _swarm_checked:
+        return _docker_client
+    _swarm_checked = True
+    try:
+        client = docker.from_env()
+        swarm = client.info().get("Swarm", {})
+    except docker.errors.DockerException:
+        return None
+    if swarm.get("LocalNodeState") == "active" and swarm.get("ControlAvailable"):
+        _docker_client = client
+    return _docker_client
+
+
+def _scale_swarm(replicas: int) -> bool:
+    client = _swarm_client()
+    if client is None:
+        return False
+    try:
+        client.services.get(SWARM_SERVICE).scale(replicas)
+    except docker.errors.DockerException as exc:
+        print(f"[autoscaler] swarm scale failed ({exc}); falling back to compose")
+        return False
+    return True
+
+
 def scale_to(replicas: int):
     replicas = max(MIN_REPLICAS, min(MAX_REPLICAS, replicas))
+    # Scaling the Swarm service in place avoids re-parsing the compose file
+    # and re-resolving every service on each adjustment.
+    if _scale_swarm(replicas):
+        return
     subprocess.check_call(
         [
             "docker",
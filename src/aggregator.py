@@ -2,13 +2,14 @@
 """Sovereign FL Aggregator with Multi-Krum Byzantine tolerance"""
 
 import flwr as fl
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
+import io
 import os
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
-from scipy.spatial.distance import cdist  # Added for vectorized distance calculation
 from prometheus_client import start_http_server, Counter, Gauge
 import logging
 
@@ -25,6 +26,29 @@ AGGREGATION_PATH_COUNTER = Counter(
     ["impl"],
 )
 
+# Columns per float64 block when accumulating the Multi-Krum Gram matrix
+GRAM_BLOCK_COLUMNS = 1 << 16
+# Consecutive failed rounds before the CUDA Krum path is switched off
+KRUM_DEVICE_MAX_FAILURES = 3
+
+
+def _ndarray_view(tensor: bytes) -> np.ndarray:
+    """Read-only view of an ``np.save`` payload without copying the data.
+
+    Flower's ``ndarray_to_bytes`` serializes each layer with ``np.save``;
+    ``bytes_to_ndarray`` then copies it out again through ``np.load``.
+    """
+    header = io.BytesIO(tensor)
+    version = np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    array = np.frombuffer(
+        tensor, dtype=dtype, count=int(np.prod(shape)), offset=header.tell()
+    )
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
 
 class MNISTNet(nn.Module):
     def __init__(self):
@@ -40,8 +64,8 @@ class MNISTNet(nn.Module):
         x = F.max_pool2d(x, 2)
         x = torch.flatten(x, 1)
         x = F.relu(self.fc1(x))
-        x = self.fc2(x)
-        return F.log_softmax(x, dim=1)
+        # Returns logits to match the MNISTNet in src/client.py.
+        return self.fc2(x)
 
 
 class MultiKrumStrategy(fl.server.strategy.Strategy):
@@ -57,11 +81,27 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
             "FL_AGGREGATION_VECTORIZE_MAX_PEAK_BYTES", 512 * 1024 * 1024
         )
         self._last_aggregation_impl = ""
+        # Packed (n, d) float32 update matrix reused across rounds; rows grow on
+        # demand and layer offsets are cached from the first round's shapes.
+        self._X = None
+        self._layer_shapes = None
+        self._offsets = None
+        # Optional file backing for the packed matrix so large cohorts page
+        # through the OS cache instead of pinning n * model_bytes of heap.
+        self.pack_file = os.getenv("FL_AGGREGATION_PACK_FILE", "").strip() or None
+        self.krum_device = self._select_krum_device()
+        self._krum_device_failures = 0
+        self.pack_workers = self._parse_positive_int_env(
+            "FL_AGGREGATION_PACK_WORKERS", min(4, os.cpu_count() or 1)
+        )
         logger.info(
-            "FL aggregation config: mode=%s vectorize_min_clients=%d vectorize_max_peak_bytes=%d",
+            "FL aggregation config: mode=%s vectorize_min_clients=%d vectorize_max_peak_bytes=%d pack_file=%s pack_workers=%d krum_device=%s",
             self.aggregation_mode,
             self.vectorize_min_clients,
             self.vectorize_max_peak_bytes,
+            self.pack_file,
+            self.pack_workers,
+            self.krum_device,
         )
 
     def _parse_aggregation_mode(self) -> str:
@@ -71,6 +111,22 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
             return "auto"
         return mode
 
+    def _select_krum_device(self):
+        # Opt-in: the Gram matrix is accumulated in float64, which is slow on
+        # most GPUs, and the full (n, d) matrix is copied to the device every
+        # round.
+        mode = os.getenv("FL_KRUM_DEVICE", "cpu").strip().lower()
+        if mode not in {"auto", "cpu", "cuda"}:
+            logger.warning("Invalid FL_KRUM_DEVICE=%s, defaulting to cpu", mode)
+            mode = "cpu"
+        if mode == "cpu":
+            return None
+        if torch.cuda.is_available():
+            return torch.device("cuda")
+        if mode == "cuda":
+            logger.warning("FL_KRUM_DEVICE=cuda but CUDA is unavailable, using CPU")
+        return None
+
     def _parse_positive_int_env(self, key: str, default: int) -> int:
         raw = os.getenv(key)
         if raw is None or raw.strip() == "":
@@ -100,16 +156,17 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
         if not results:
             return None, {}
 
-        weights_list = [
-            fl.common.parameters_to_ndarrays(res.parameters) for _, res in results
-        ]
-        selected_indices = self._multi_krum_select(weights_list)
+        weights_list = [self._layer_views(res.parameters) for _, res in results]
+        packed = self._pack_updates(weights_list)
+        selected_indices = self._multi_krum_select(weights_list, packed=packed)
 
         byzantine_count = len(weights_list) - len(selected_indices)
         BYZANTINE_COUNTER.inc(byzantine_count)
 
         aggregated = self._aggregate_weights(
-            [weights_list[i] for i in selected_indices]
+            [weights_list[i] for i in selected_indices],
+            packed=packed,
+            selected_indices=selected_indices,
         )
         parameters_aggregated = fl.common.ndarrays_to_parameters(aggregated)
 
@@ -120,27 +177,132 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
 
         return parameters_aggregated, {}
 
-    def _multi_krum_select(self, weights_list):
+    def _pairwise_sq_distances_torch(self, X: np.ndarray) -> np.ndarray:
+        """GPU variant of _pairwise_sq_distances; only the n x n result returns."""
+        Xg = torch.from_numpy(np.asarray(X)).to(self.krum_device)
+        n, d = Xg.shape
+        gram = torch.zeros((n, n), dtype=torch.float64, device=self.krum_device)
+        for start in range(0, d, GRAM_BLOCK_COLUMNS):
+            block = Xg[:, start : start + GRAM_BLOCK_COLUMNS].double()
+            gram.addmm_(block, block.T)
+        sq_norms = gram.diagonal().clone()
+        distances = gram
+        distances.mul_(-2.0).add_(sq_norms[:, None]).add_(sq_norms[None, :])
+        distances.clamp_(min=0.0).fill_diagonal_(0.0)
+        return distances.cpu().numpy()
+
+    def _layer_views(self, parameters) -> List[np.ndarray]:
+        if parameters.tensor_type != "numpy.ndarray":
+            return fl.common.parameters_to_ndarrays(parameters)
+        # Views over the received bytes; _pack_updates makes the only copy.
+        return [_ndarray_view(tensor) for tensor in parameters.tensors]
+
+    def _multi_krum_select(self, weights_list, packed=None):
         n = len(weights_list)
         m = self.num_byzantine
 
-        flattened = np.array(
-            [np.concatenate([w.flatten() for w in weights]) for weights in weights_list]
-        )
-        distances = cdist(flattened, flattened, metric="euclidean")
+        if packed is None:
+            packed = self._pack_updates(weights_list)
+        distances = None
+        if self.krum_device is not None:
+            try:
+                distances = self._pairwise_sq_distances_torch(packed)
+                self._krum_device_failures = 0
+            except RuntimeError as e:
+                # Covers CUDA OOM; a transient failure only costs this round.
+                self._krum_device_failures += 1
+                logger.warning(
+                    "Krum distances on %s failed (%s), falling back to CPU",
+                    self.krum_device,
+                    e,
+                )
+                if self._krum_device_failures >= KRUM_DEVICE_MAX_FAILURES:
+                    logger.warning(
+                        "Krum distances failed on %s %d rounds in a row, using CPU",
+                        self.krum_device,
+                        self._krum_device_failures,
+                    )
+                    self.krum_device = None
+        if distances is None:
+            distances = self._pairwise_sq_distances(packed)
+
+        # Scores sum squared distances, as in the original Krum definition
+        # (Blanchard et al., 2017). This replaces the earlier sum of plain
+        # Euclidean distances, which can rank candidates differently. Row i's
+        # smallest entry is its own zero self-distance, so a partition over
+        # num_neighbors + 1 entries sums self plus the num_neighbors closest
+        # peers without a full sort per row.
+        num_neighbors = max(0, min(n - m - 2, n - 1))
+        nearest = np.partition(distances, num_neighbors, axis=1)
+        scores = nearest[:, : num_neighbors + 1].sum(axis=1)
 
-        scores = []
-        num_neighbors = n - m - 2
-        for i in range(n):
-            sorted_dists = np.sort(distances[i])
-            score = np.sum(sorted_dists[1 : num_neighbors + 1])
-            scores.append((score, i))
-
-        scores.sort()
         num_selection = min(n - 2 * m + 2, n)
-        return [idx for _, idx in scores[:num_selection]]
+        order = np.argsort(scores, kind="stable")
+        return order[:num_selection].tolist()
+
+    def _pack_updates(self, weights_list: List[List[np.ndarray]]) -> np.ndarray:
+        """Copy each client's layers into its row of the shared (n, d) buffer."""
+        shapes = [w.shape for w in weights_list[0]]
+        if shapes != self._layer_shapes:
+            self._layer_shapes = shapes
+            self._offsets = np.concatenate(
+                ([0], np.cumsum([int(np.prod(shape)) for shape in shapes]))
+            ).tolist()
+            self._X = None
 
-    def _aggregate_weights(self, weights_list):
+        n = len(weights_list)
+        d = self._offsets[-1]
+        if self._X is None or self._X.shape[0] < n:
+            self._X = None  # drop any old memmap before the file is resized
+            if self.pack_file is not None:
+                self._X = np.memmap(
+                    self.pack_file, dtype=np.float32, mode="w+", shape=(n, d)
+                )
+            else:
+                self._X = np.empty((n, d), dtype=np.float32)
+
+        X = self._X[:n]
+        if self.pack_workers > 1 and n > 1:
+            # NumPy releases the GIL for these bulk copies, so rows pack in
+            # parallel across threads.
+            with ThreadPoolExecutor(max_workers=self.pack_workers) as executor:
+                list(executor.map(self._pack_row, X, weights_list))
+        else:
+            for row, weights in zip(X, weights_list):
+                self._pack_row(row, weights)
+        return X
+
+    def _pack_row(self, row: np.ndarray, weights: List[np.ndarray]) -> None:
+        offsets = self._offsets
+        for k, layer in enumerate(weights):
+            # ravel() is a view for contiguous layers, so this is one copy.
+            row[offsets[k] : offsets[k + 1]] = layer.ravel()
+
+    @staticmethod
+    def _pairwise_sq_distances(X: np.ndarray) -> np.ndarray:
+        """Squared euclidean distances via ||x||^2 + ||y||^2 - 2 X X^T.
+
+        Updates are absolute weights around a shared global model, so ||x||^2
+        is orders of magnitude above the pairwise distances and a float32 Gram
+        matrix cancels to noise. The Gram matrix is accumulated in float64
+        over column blocks, which keeps the temporary at n x GRAM_BLOCK_COLUMNS.
+        """
+        n, d = X.shape
+        gram = np.zeros((n, n), dtype=np.float64)
+        for start in range(0, d, GRAM_BLOCK_COLUMNS):
+            block = X[:, start : start + GRAM_BLOCK_COLUMNS].astype(np.float64)
+            gram += block @ block.T
+        sq_norms = gram.diagonal().copy()
+        distances = gram
+        distances *= -2.0
+        distances += sq_norms[:, None]
+        distances += sq_norms[None, :]
+        # Rounding can leave tiny negatives and a non-zero diagonal.
+        np.maximum(distances, 0.0, out=distances)
+        np.fill_diagonal(distances, 0.0)
+        return distances
+
+    def _aggregate_weights(self, weights_list, packed=None, selected_indices=None):
         use_vectorized = self._should_use_vectorized(weights_list)
         impl = "vectorized" if use_vectorized else "loop"
         AGGREGATION_PATH_COUNTER.labels(impl=impl).inc()
@@ -153,6 +315,8 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
             )
             self._last_aggregation_impl = impl
 
+        if use_vectorized and packed is not None:
+            return self._aggregate_weights_packed(packed, selected_indices)
         if use_vectorized:
             return self._aggregate_weights_vectorized(weights_list)
         return self._aggregate_weights_loop(weights_list)
@@ -217,6 +381,21 @@ class MultiKrumStrategy(fl.server.strategy.Strategy):
             )
         return aggregated
 
+    def _aggregate_weights_packed(
+        self, packed: np.ndarray, selected_indices: List[int]
+    ) -> List[np.ndarray]:
+        # Mean of the selected rows as one GEMV over the packed matrix; this
+        # avoids gathering X[selected] into a temporary copy.
+        row_weights = np.zeros(packed.shape[0], dtype=packed.dtype)
+        row_weights[selected_indices] = 1.0 / len(selected_indices)
+        mean_flat = row_weights @ packed
+
+        offsets = self._offsets
+        return [
+            mean_flat[offsets[k] : offsets[k + 1]].reshape(shape)
+            for k, shape in enumerate(self._layer_shapes)
+        ]
+
     def configure_evaluate(self, server_round, parameters, client_manager):
         return []
 
@@ -22,8 +22,8 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 from opacus import PrivacyEngine
-from torch.utils.data import DataLoader, Subset
-from torchvision import datasets, transforms
+from torch.utils.data import DataLoader
+from torchvision import datasets
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -83,8 +83,8 @@ class MNISTNet(nn.Module):
         x = F.max_pool2d(x, 2)
         x = torch.flatten(x, 1)
         x = F.relu(self.fc1(x))
-        x = self.fc2(x)
-        return F.log_softmax(x, dim=1)
+        # Raw logits; training applies F.cross_entropy (fused log-softmax + NLL).
+        return self.fc2(x)
 
 
 # ============================================================================
@@ -104,6 +104,7 @@ class SovereignClient(fl.client.NumPyClient):
         self.node_id = node_id
         self.byzantine = byzantine
         self.server_address = server_address
+        self._state_tensors = None
         self.device = self._select_device()
         self.model = self._initialize_model_on_device()
         self.batch_size = int(os.getenv("BATCH_SIZE", "16"))
@@ -121,6 +122,10 @@ class SovereignClient(fl.client.NumPyClient):
         self.llm_target_modules = os.getenv(
             "LLM_ADAPTER_TARGET_MODULES", "q_proj,v_proj"
         )
+        # The device is final here (model init may have fallen back to CPU).
+        self._configure_cpu_threads()
+        self.memory_format = self._select_memory_format()
+        self.model = self.model.to(memory_format=self.memory_format)
         self.trainloader = self._load_data(node_id)
         self.optimizer = torch.optim.SGD(self.model.parameters(), lr=0.01)
 
@@ -172,6 +177,35 @@ class SovereignClient(fl.client.NumPyClient):
             model = model.to(self.device)
         return model
 
+    def _configure_cpu_threads(self) -> None:
+        """Cap intra-op threads when several clients share one host's cores."""
+        if str(self.device) != "cpu":
+            return
+        num_threads = os.getenv("TORCH_NUM_THREADS")
+        if num_threads is None:
+            clients_per_host = os.getenv("CLIENTS_PER_HOST")
+            if clients_per_host is None:
+                return
+            num_threads = (os.cpu_count() or 1) // max(int(clients_per_host), 1)
+        torch.set_num_threads(max(int(num_threads), 1))
+        logger.info(
+            "Node %s: Using %d CPU threads", self.node_id, torch.get_num_threads()
+        )
+
+    def _select_memory_format(self) -> "torch.memory_format":
+        """Opt-in NHWC on CPU (CHANNELS_LAST=true) for oneDNN's blocked conv kernels."""
+        if str(self.device) != "cpu" or not self._env_enabled("CHANNELS_LAST", "false"):
+            return torch.contiguous_format
+        if self.enable_dp:
+            # Opacus per-sample gradients break the channels_last gradient
+            # layout contract on conv weights, which slows training down.
+            logger.warning(
+                "Node %s: CHANNELS_LAST ignored with differential privacy enabled",
+                self.node_id,
+            )
+            return torch.contiguous_format
+        return torch.channels_last
+
     def _env_enabled(self, name: str, default: str = "true") -> bool:
         """Parse boolean environment flags consistently."""
         return os.getenv(name, default).lower() in ("1", "true", "yes")
@@ -271,6 +305,8 @@ class SovereignClient(fl.client.NumPyClient):
         logger.warning(f"Node {self.node_id}: Falling back to CPU ({reason})")
         self.device = torch.device("cpu")
         self.model = self.model.to(self.device)
+        self._state_tensors = None
+        self._configure_cpu_threads()
 
     def _select_device(self) -> torch.device:
         """Select training device with NPU/XPU/CUDA/MPS/CPU fallback."""
@@ -341,14 +377,10 @@ class SovereignClient(fl.client.NumPyClient):
 
     def _load_data(self, node_id: int) -> DataLoader:
         """Load MNIST data with node-specific subset."""
-        transform = transforms.Compose(
-            [transforms.ToTensor(), transforms.Normalize((0.1307,), (0.3081,))]
-        )
+        from torch.utils.data import TensorDataset
 
         try:
-            dataset = datasets.MNIST(
-                "./data", train=True, download=True, transform=transform
-            )
+            dataset = datasets.MNIST("./data", train=True, download=True)
         except Exception as e:
             logger.warning(f"Could not download MNIST, using random data: {e}")
             # Fallback: generate random data
@@ -359,7 +391,13 @@ class SovereignClient(fl.client.NumPyClient):
         start_idx = (node_id % (len(dataset) // samples_per_node)) * samples_per_node
         end_idx = min(start_idx + samples_per_node, len(dataset))
 
-        subset = Subset(dataset, range(start_idx, end_idx))
+        # Normalize this node's slice once, matching ToTensor + Normalize, rather
+        # than decoding and transforming every sample on every epoch. The full
+        # 60k-image tensor is released when `dataset` goes out of scope.
+        images = dataset.data[start_idx:end_idx].unsqueeze(1).float()
+        images.div_(255.0).sub_(0.1307).div_(0.3081)
+        labels = dataset.targets[start_idx:end_idx].clone()
+        subset = TensorDataset(images, labels)
         logger.info(f"Node {self.node_id}: Loaded {len(subset)} training samples")
         return DataLoader(subset, batch_size=self.batch_size, shuffle=True)
 
@@ -374,13 +412,48 @@ class SovereignClient(fl.client.NumPyClient):
 
     def get_parameters(self, config: Dict) -> List[np.ndarray]:
         """Extract model parameters as numpy arrays."""
-        return [val.cpu().numpy() for _, val in self.model.state_dict().items()]
+        return self._export_parameters()
+
+    def _export_parameters(self, negate: bool = False) -> List[np.ndarray]:
+        """Export state tensors, optionally sign-flipped on the device first."""
+        state = list(self.model.state_dict().values())
+        if str(self.device) == "cpu":
+            # .numpy() shares memory with CPU tensors, so this copies nothing
+            # unless the update is negated.
+            return [(val.neg() if negate else val).numpy() for val in state]
+
+        # On accelerators, pack on the device and cross to the host once per
+        # dtype instead of issuing one small transfer per layer. Packing each
+        # dtype separately keeps torch.cat from promoting integer buffers
+        # (e.g. num_batches_tracked) to the weights' float dtype.
+        groups = {}
+        for i, val in enumerate(state):
+            groups.setdefault(val.dtype, []).append(i)
+        params = [None] * len(state)
+        for indices in groups.values():
+            flat = torch.cat([state[i].reshape(-1) for i in indices])
+            if negate:
+                flat.neg_()
+            host = flat.cpu().numpy()
+            offset = 0
+            for i in indices:
+                size = state[i].numel()
+                params[i] = host[offset : offset + size].reshape(tuple(state[i].shape))
+                offset += size
+        return params
 
     def set_parameters(self, parameters: List[np.ndarray]) -> None:
         """Set model parameters from numpy arrays."""
-        params_dict = zip(self.model.state_dict().keys(), parameters)
-        state_dict = {k: torch.tensor(v) for k, v in params_dict}
-        self.model.load_state_dict(state_dict, strict=False)
+        # Copy into the live state tensors in get_parameters order instead of
+        # building a fresh state dict; this also sidesteps the "_module." key
+        # prefix Opacus adds once the model is wrapped.
+        if self._state_tensors is None:
+            self._state_tensors = list(self.model.state_dict().values())
+        with torch.no_grad():
+            for dst, src in zip(self._state_tensors, parameters):
+                # np.ascontiguousarray would turn 0-d buffers such as
+                # num_batches_tracked into shape (1,); np.require keeps them.
+                dst.copy_(torch.from_numpy(np.require(src, requirements="C")))
 
     def fit(
         self, parameters: List[np.ndarray], config: Dict
@@ -399,14 +472,16 @@ class SovereignClient(fl.client.NumPyClient):
             try:
                 for data, target in self.trainloader:
                     try:
-                        data, target = data.to(self.device), target.to(self.device)
+                        data = data.to(self.device, memory_format=self.memory_format)
+                        target = target.to(self.device)
                     except Exception as e:
                         self._fallback_to_cpu(f"batch transfer failed: {e}")
-                        data, target = data.to(self.device), target.to(self.device)
+                        data = data.to(self.device, memory_format=self.memory_format)
+                        target = target.to(self.device)
 
                     self.optimizer.zero_grad()
                     output = self.model(data)
-                    loss = F.nll_loss(output, target)
+                    loss = F.cross_entropy(output, target)
                     loss.backward()
                     self.optimizer.step()
 
@@ -427,14 +502,13 @@ class SovereignClient(fl.client.NumPyClient):
             except Exception as e:
                 logger.debug(f"Node {self.node_id}: Could not get epsilon: {e}")
 
-        updated_params = self.get_parameters(config)
+        # Byzantine attack: invert parameters. Negation happens during export,
+        # and the L2 norm is unaffected by the sign flip.
+        updated_params = self._export_parameters(negate=self.byzantine)
         update_l2_norm = float(
             np.sqrt(sum(float(np.square(param).sum()) for param in updated_params))
         )
-
-        # Byzantine attack: invert parameters
         if self.byzantine:
-            updated_params = [-p for p in updated_params]
             logger.warning(f"Node {self.node_id}: Sent BYZANTINE update")
 
         num_samples = len(self.trainloader.dataset)
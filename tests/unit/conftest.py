@@ -0,0 +1,23 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+LEGACY_BACKEND_FILE = (
+    ROOT / "docs" / "archive" / "legacy" / "code" / "sovereignmap_production_backend.py"
+)
+
+
+@pytest.fixture(scope="session")
+def legacy_backend():
+    # Loaded once per session: the module registers its Prometheus metrics in
+    # the default registry at import time.
+    for dep in ("ecdsa", "flask", "prometheus_flask_exporter", "prometheus_client"):
+        pytest.importorskip(dep)
+    spec = importlib.util.spec_from_file_location(
+        "legacy_production_backend", LEGACY_BACKEND_FILE
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
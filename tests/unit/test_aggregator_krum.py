@@ -0,0 +1,128 @@
+import importlib.util
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+AGGREGATOR_FILE = ROOT / "src" / "aggregator.py"
+
+LAYER_SHAPES = [(6, 5), (5,), (3, 4)]
+
+
+@pytest.fixture(scope="module")
+def aggregator():
+    for dep in ("torch", "flwr", "prometheus_client"):
+        pytest.importorskip(dep)
+    spec = importlib.util.spec_from_file_location(
+        "aggregator_under_test", AGGREGATOR_FILE
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def strategy(aggregator, monkeypatch):
+    monkeypatch.setenv("FL_KRUM_DEVICE", "cpu")
+    monkeypatch.setenv("FL_AGGREGATION_PACK_WORKERS", "1")
+
+    class _Strategy(aggregator.MultiKrumStrategy):
+        # Strategy.evaluate is abstract; the aggregator never evaluates
+        # centrally, so stub it to make the class instantiable.
+        def evaluate(self, server_round, parameters):
+            return None
+
+    return _Strategy(num_clients=20, num_byzantine=4)
+
+
+def _reference_krum(weights_list, num_byzantine):
+    """Textbook Krum over flattened updates with a full O(n^2) loop."""
+    vectors = [
+        np.concatenate([layer.ravel() for layer in w]).astype(np.float64)
+        for w in weights_list
+    ]
+    n = len(vectors)
+    num_neighbors = max(0, min(n - num_byzantine - 2, n - 1))
+    scores = []
+    for i in range(n):
+        dists = sorted(
+            float(np.sum((vectors[i] - vectors[j]) ** 2)) for j in range(n) if j != i
+        )
+        scores.append(sum(dists[:num_neighbors]))
+    num_selection = min(n - 2 * num_byzantine + 2, n)
+    return np.argsort(scores, kind="stable")[:num_selection].tolist()
+
+
+def _client_updates(rng, n, num_byzantine, base_scale=1.0, noise=1e-2):
+    # Updates are absolute weights around one shared global model; the
+    # Byzantine clients send the sign-flipped model.
+    base = [rng.standard_normal(shape) * base_scale for shape in LAYER_SHAPES]
+    updates = []
+    for i in range(n):
+        layers = [b + rng.standard_normal(b.shape) * noise for b in base]
+        if i < num_byzantine:
+            layers = [-layer for layer in layers]
+        updates.append([layer.astype(np.float32) for layer in layers])
+    order = rng.permutation(n)
+    return [updates[i] for i in order]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_selection_matches_reference(strategy, seed):
+    rng = np.random.default_rng(seed)
+    updates = _client_updates(rng, n=20, num_byzantine=4)
+
+    selected = strategy._multi_krum_select(updates)
+
+    assert selected == _reference_krum(updates, num_byzantine=4)
+
+
+def test_selection_matches_reference_near_large_shared_base(strategy):
+    # ||x||^2 dwarfs the pairwise distances here, which is where a float32
+    # Gram matrix used to cancel to noise.
+    rng = np.random.default_rng(7)
+    updates = _client_updates(rng, n=20, num_byzantine=4, base_scale=50.0, noise=1e-3)
+
+    selected = strategy._multi_krum_select(updates)
+
+    assert selected == _reference_krum(updates, num_byzantine=4)
+
+
+def test_selection_drops_sign_flipped_updates(strategy):
+    rng = np.random.default_rng(11)
+    base = [rng.standard_normal(shape) for shape in LAYER_SHAPES]
+    updates = [
+        [(b + rng.standard_normal(b.shape) * 1e-2).astype(np.float32) for b in base]
+        for _ in range(20)
+    ]
+    byzantine = {2, 9, 13, 17}
+    for i in byzantine:
+        updates[i] = [-layer for layer in updates[i]]
+
+    selected = strategy._multi_krum_select(updates)
+
+    assert byzantine.isdisjoint(selected)
+
+
+@pytest.mark.parametrize("mode", ["loop", "vectorized"])
+def test_aggregate_fit_mean_of_selected(aggregator, strategy, mode):
+    import flwr as fl
+
+    strategy.aggregation_mode = mode
+    rng = np.random.default_rng(3)
+    updates = _client_updates(rng, n=20, num_byzantine=4)
+    results = [
+        (None, types.SimpleNamespace(parameters=fl.common.ndarrays_to_parameters(u)))
+        for u in updates
+    ]
+
+    parameters, _ = strategy.aggregate_fit(1, results, [])
+
+    selected = _reference_krum(updates, num_byzantine=4)
+    aggregated = fl.common.parameters_to_ndarrays(parameters)
+    assert [a.shape for a in aggregated] == LAYER_SHAPES
+    for k, layer in enumerate(aggregated):
+        expected = np.mean([updates[i][k] for i in selected], axis=0)
+        np.testing.assert_allclose(layer, expected, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,89 @@
+import importlib.util
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+CLIENT_FILE = ROOT / "src" / "client.py"
+
+
+@pytest.fixture(scope="module")
+def client_module():
+    for dep in ("torch", "torchvision", "flwr", "opacus"):
+        pytest.importorskip(dep)
+    spec = importlib.util.spec_from_file_location(
+        "client_params_under_test", CLIENT_FILE
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _holder(model, device):
+    # Just the attributes _export_parameters and set_parameters read, so no
+    # data loaders or privacy engine are built.
+    return types.SimpleNamespace(model=model, device=device, _state_tensors=None)
+
+
+def _bn_model():
+    import torch.nn as nn
+
+    # BatchNorm brings an int64 num_batches_tracked buffer next to the
+    # float32 weights.
+    model = nn.Sequential(nn.Conv2d(1, 4, 3), nn.BatchNorm2d(4))
+    model[1].num_batches_tracked.fill_(7)
+    return model
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_export_keeps_state_dtypes(client_module, device):
+    # "cuda:0" only selects the packed accelerator branch; the tensors stay on
+    # the CPU, which torch.cat handles the same way.
+    model = _bn_model()
+    holder = _holder(model, device)
+
+    params = client_module.SovereignClient._export_parameters(holder)
+
+    state = list(model.state_dict().values())
+    assert [p.dtype for p in params] == [t.numpy().dtype for t in state]
+    for param, tensor in zip(params, state):
+        np.testing.assert_array_equal(param, tensor.numpy())
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_set_then_export_round_trip(client_module, device):
+    model = _bn_model()
+    holder = _holder(model, device)
+    rng = np.random.default_rng(0)
+    incoming = [
+        rng.standard_normal(p.shape).astype(p.dtype)
+        for p in client_module.SovereignClient._export_parameters(holder)
+    ]
+    incoming[-1] = np.array(3, dtype=np.int64)  # num_batches_tracked
+
+    client_module.SovereignClient.set_parameters(holder, incoming)
+    exported = client_module.SovereignClient._export_parameters(holder)
+
+    assert len(exported) == len(incoming)
+    for got, sent in zip(exported, incoming):
+        assert got.dtype == sent.dtype
+        np.testing.assert_array_equal(got, sent)
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_byzantine_export_negates_without_touching_model(client_module, device):
+    model = _bn_model()
+    holder = _holder(model, device)
+    before = [
+        p.copy() for p in client_module.SovereignClient._export_parameters(holder)
+    ]
+
+    negated = client_module.SovereignClient._export_parameters(holder, negate=True)
+
+    for flipped, original in zip(negated, before):
+        np.testing.assert_array_equal(flipped, -original)
+    after = client_module.SovereignClient._export_parameters(holder)
+    for current, original in zip(after, before):
+        np.testing.assert_array_equal(current, original)
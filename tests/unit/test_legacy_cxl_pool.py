@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def pool(legacy_backend, monkeypatch):
+    monkeypatch.setattr(legacy_backend, "SIMULATE_ACCESS_SLEEP", True)
+    pool = legacy_backend.CXLPool()
+    # A fixed 300 us per access crosses the 1 ms sleep threshold often.
+    monkeypatch.setattr(pool, "_next_sample", lambda: (300_000.0, False))
+    return pool
+
+
+def test_simulated_sleep_accounts_for_every_access(legacy_backend, pool, monkeypatch):
+    key = legacy_backend.generate_signing_key()
+    enclave_id = pool.create_enclave(0, key, 1.0)
+    slept = []
+    real_sleep = legacy_backend.time.sleep
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        # Yield so other request threads run while this one "sleeps".
+        real_sleep(1e-4)
+
+    monkeypatch.setattr(legacy_backend.time, "sleep", fake_sleep)
+    threads, per_thread = 8, 500
+
+    def worker():
+        for _ in range(per_thread):
+            pool.access_memory(0, key, enclave_id)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    total_ns = threads * per_thread * 300_000.0 * pool.tiering_factor
+    accounted_ns = sum(slept) * 1e9 + pool._pending_sleep_ns
+    assert accounted_ns == pytest.approx(total_ns, rel=1e-9)
@@ -0,0 +1,61 @@
+import pytest
+
+REGISTRY = pytest.importorskip("prometheus_client").REGISTRY
+
+
+@pytest.fixture
+def backend(legacy_backend, monkeypatch):
+    monkeypatch.setattr(legacy_backend, "dao", legacy_backend.MockDAO())
+    legacy_backend.flush_metrics()
+    return legacy_backend
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_votes_are_counted_on_flush(backend):
+    founder = backend.FOUNDERS[0][1]
+    before = _sample("sovereignmap_dao_votes_total")
+
+    assert backend.dao.vote_proposal("p1", founder, True)
+    assert backend.dao.vote_proposal("p1", founder, False)
+    assert not backend.dao.vote_proposal("p1", "Unknown University", True)
+    assert _sample("sovereignmap_dao_votes_total") == before
+
+    backend.flush_metrics()
+
+    assert _sample("sovereignmap_dao_votes_total") == before + 2
+    assert len(backend.dao.pending_votes) == 0
+
+
+def test_access_events_are_counted_on_flush(backend):
+    labels = {"result": "success", "operation": "read"}
+    before = _sample("sovereignmap_enclave_access_total", **labels)
+    observed = _sample("sovereignmap_cxl_access_latency_ns_count")
+
+    for latency in (90.0, 100.0, 110.0):
+        backend.access_events.append(("success", "read", latency))
+    backend.access_events.append(("failure", "write", 95.0))
+
+    assert backend.flush_access_metrics() == 4
+    assert _sample("sovereignmap_enclave_access_total", **labels) == before + 3
+    assert _sample("sovereignmap_cxl_access_latency_ns_count") == observed + 4
+    assert len(backend.access_events) == 0
+
+
+def test_full_buffer_flushes_inline(backend, monkeypatch):
+    monkeypatch.setattr(backend, "METRICS_FLUSH_BATCH", 3)
+    founder = backend.FOUNDERS[0][1]
+    before = _sample("sovereignmap_dao_votes_total")
+
+    for _ in range(2):
+        backend.dao.vote_proposal("p2", founder, True)
+        backend._flush_if_full()
+    assert len(backend.dao.pending_votes) == 2
+
+    backend.dao.vote_proposal("p2", founder, True)
+    backend._flush_if_full()
+
+    assert len(backend.dao.pending_votes) == 0
+    assert _sample("sovereignmap_dao_votes_total") == before + 3
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+
+def _reference_trimmed_mean(updates, trim_fraction=0.2):
+    """Per-coordinate sort, trim and stake-weight, one coordinate at a time."""
+    weights = np.array([u["stake"] * u.get("contribution_score", 1.0) for u in updates])
+    weights = weights / weights.sum()
+    stacked = np.array([np.asarray(u["weights"], dtype=np.float64) for u in updates])
+    n, d = stacked.shape
+    k = min(int(trim_fraction * n), (n - 1) // 2)
+    result = np.empty(d)
+    for j in range(d):
+        order = np.argsort(stacked[:, j])[k : n - k]
+        kept = weights[order]
+        result[j] = (stacked[order, j] * kept).sum() / kept.sum()
+    return result
+
+
+def _updates(rows, stakes):
+    return [
+        {"node_id": i, "weights": row, "stake": float(stake)}
+        for i, (row, stake) in enumerate(zip(rows, stakes))
+    ]
+
+
+def test_matches_reference(legacy_backend):
+    rng = np.random.default_rng(0)
+    rows = rng.standard_normal((10, 64)).astype(np.float32)
+    updates = _updates(rows, rng.uniform(50, 150, size=10))
+
+    result = legacy_backend.stake_weighted_trimmed_mean(updates)
+
+    np.testing.assert_allclose(result, _reference_trimmed_mean(updates), rtol=1e-5)
+
+
+def test_stacked_matches_list_input(legacy_backend):
+    rng = np.random.default_rng(1)
+    rows = rng.standard_normal((8, 32)).astype(np.float32)
+    stakes = rng.uniform(50, 150, size=8)
+    updates = _updates(rows, stakes)
+
+    from_list = legacy_backend.stake_weighted_trimmed_mean(updates)
+    from_stacked = legacy_backend.stake_weighted_trimmed_mean(
+        updates, stacked=rows, stakes=stakes
+    )
+
+    np.testing.assert_allclose(from_list, from_stacked, rtol=1e-6)
+
+
+@pytest.mark.parametrize("permute", ["reverse", "by_stake", "filtered"])
+def test_permuted_views_into_round_buffer(legacy_backend, permute):
+    # /fl_round hands out rows of the shared update buffer as update weights.
+    rng = np.random.default_rng(2)
+    n, d = 10, 48
+    buf = legacy_backend._update_buffer(n, d)
+    buf[:] = rng.standard_normal((n, d))
+    updates = _updates(buf, rng.uniform(50, 150, size=n))
+    if permute == "reverse":
+        updates = updates[::-1]
+    elif permute == "by_stake":
+        updates = sorted(updates, key=lambda u: u["stake"])
+    else:
+        updates = updates[1::2] + updates[::2]
+    expected = _reference_trimmed_mean(updates)
+    snapshot = buf.copy()
+
+    result = legacy_backend.stake_weighted_trimmed_mean(updates)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-5)
+    np.testing.assert_array_equal(buf, snapshot)
+
+
+def test_zero_kept_stake_falls_back_to_unweighted_mean(legacy_backend):
+    # Only the two outliers carry stake, and trimming drops both of them.
+    rng = np.random.default_rng(3)
+    rows = rng.standard_normal((10, 16)).astype(np.float32)
+    rows[:2] = 1000.0
+    stakes = np.zeros(10)
+    stakes[:2] = 100.0
+    updates = _updates(rows, stakes)
+
+    result = legacy_backend.stake_weighted_trimmed_mean(updates)
+
+    assert np.isfinite(result).all()
+    expected = np.sort(rows, axis=0)[2:8].mean(axis=0)
+    np.testing.assert_allclose(result, expected, rtol=1e-5)
+
+
+def test_zero_total_stake_returns_none(legacy_backend):
+    rows = np.ones((4, 8), dtype=np.float32)
+
+    assert (
+        legacy_backend.stake_weighted_trimmed_mean(_updates(rows, np.zeros(4))) is None
+    )